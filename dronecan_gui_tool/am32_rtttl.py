@@ -9,6 +9,10 @@ import re
 import math
 import dronecan
 
+NOTE_ORDER = ('c', 'c#', 'd', 'd#', 'e', 'f', 'f#', 'g', 'g#', 'a', 'a#', 'b')
+NOTE_INDEX = {note: i for i, note in enumerate(NOTE_ORDER)}
+NOTE_REGEX = re.compile(r'(1|2|4|8|16|32|64)?((?:[a-g]|h|p)#?){1}(\.*)(1|2|3|4|5|6|7|8)?(\.*)')
+
 class AM32_Rtttl:
     @staticmethod
     def parse(rtttl):
@@ -216,37 +220,30 @@ class AM32_Rtttl:
 
     @staticmethod
     def _calculate_semitones_from_c4(note, octave):
-        NOTE_ORDER = ['c', 'c#', 'd', 'd#', 'e', 'f', 'f#', 'g', 'g#', 'a', 'a#', 'b']
         MIDDLE_OCTAVE = 4
         SEMITONES_IN_OCTAVE = 12
         OCTAVE_JUMP = (int(octave) - MIDDLE_OCTAVE) * SEMITONES_IN_OCTAVE
-        return NOTE_ORDER.index(note) + OCTAVE_JUMP
+        return NOTE_INDEX[note] + OCTAVE_JUMP
+
+    @staticmethod
+    def _calculate_note_duration(beat_every, note_duration, dots):
+        DURATION = (beat_every * 4) / note_duration
+        return DURATION * (1.9375 if dots == 4 else 1.875 if dots == 3 else 1.75 if dots == 2 else 1.5 if dots == 1 else 1)
+
+    @staticmethod
+    def _calculate_note_frequency(note, octave):
+        if note == 'p':
+            return 0
+        C4 = 261.63
+        TWELFTH_ROOT = 2 ** (1 / 12)
+        N = AM32_Rtttl._calculate_semitones_from_c4(note, octave)
+        return round(C4 * (TWELFTH_ROOT ** N) * 10) / 10
 
     @staticmethod
     def get_data(melody, defaults):
         NOTES = melody.split(',')
         BEAT_EVERY = 60000 / int(defaults['bpm'])
 
-        def calculate_duration(beat_every, note_duration, dots):
-            DURATION = (beat_every * 4) / note_duration
-            return DURATION * (1.9375 if dots == 4 else 1.875 if dots == 3 else 1.75 if dots == 2 else 1.5 if dots == 1 else 1)
-
-        def calculate_frequency(note, octave):
-            if note == 'p':
-                return 0
-            C4 = 261.63
-            TWELFTH_ROOT = 2 ** (1 / 12)
-            N = AM32_Rtttl._calculate_semitones_from_c4(note, octave)
-            return round(C4 * (TWELFTH_ROOT ** N) * 10) / 10
-
-        def calculate_semitones_from_c4(note, octave):
-            NOTE_ORDER = ['c', 'c#', 'd', 'd#', 'e', 'f', 'f#', 'g', 'g#', 'a', 'a#', 'b']
-            MIDDLE_OCTAVE = 4
-            SEMITONES_IN_OCTAVE = 12
-            OCTAVE_JUMP = (octave - MIDDLE_OCTAVE) * SEMITONES_IN_OCTAVE
-            return NOTE_ORDER.index(note) + OCTAVE_JUMP
-
-        NOTE_REGEX = re.compile(r'(1|2|4|8|16|32|64)?((?:[a-g]|h|p)#?){1}(\.*)(1|2|3|4|5|6|7|8)?(\.*)')
         parsed_notes = []
 
         for note in NOTES:
@@ -259,8 +256,8 @@ class AM32_Rtttl:
 
                 parsed_notes.append({
                     'note': NOTE,
-                    'duration': calculate_duration(BEAT_EVERY, float(NOTE_DURATION), NOTE_DOTS),
-                    'frequency': calculate_frequency(NOTE, NOTE_OCTAVE)
+                    'duration': AM32_Rtttl._calculate_note_duration(BEAT_EVERY, float(NOTE_DURATION), NOTE_DOTS),
+                    'frequency': AM32_Rtttl._calculate_note_frequency(NOTE, NOTE_OCTAVE)
                 })
 
         return parsed_notes
@@ -278,7 +275,6 @@ class AM32_Rtttl:
         if freq == 0:
             return 'p'
         C4 = 261.63
-        NOTE_ORDER = ['c', 'c#', 'd', 'd#', 'e', 'f', 'f#', 'g', 'g#', 'a', 'a#', 'b']
         SEMITONES_IN_OCTAVE = 12
         note_semitones = round(SEMITONES_IN_OCTAVE * math.log2(freq / C4))
         note_index = note_semitones % SEMITONES_IN_OCTAVE if note_semitones >= 0 else 12 + note_semitones % SEMITONES_IN_OCTAVE
@@ -289,10 +285,9 @@ class AM32_Rtttl:
         if note == 'p':
             return 0
         C4 = 261.63
-        NOTE_ORDER = ['c', 'c#', 'd', 'd#', 'e', 'f', 'f#', 'g', 'g#', 'a', 'a#', 'b']
         SEMITONES_IN_OCTAVE = 12
         MIDDLE_OCTAVE = 4
-        note_index = NOTE_ORDER.index(note)
+        note_index = NOTE_INDEX[note]
         octave_diff = int(octave) - MIDDLE_OCTAVE
         semitone_diff = note_index + (octave_diff * SEMITONES_IN_OCTAVE)
         return C4 * (2 ** (semitone_diff / SEMITONES_IN_OCTAVE))
@@ -131,6 +131,7 @@ The distance should match the actual distance between the antennas.
                          node.add_handler(dronecan.ardupilot.gnss.MovingBaselineData, self.handle_RTCM_MovingBase),
                          node.add_handler(dronecan.uavcan.equipment.gnss.RTCMStream, self.handle_RTCM_Stream),
                          node.add_handler(dronecan.ardupilot.gnss.RelPosHeading, self.handle_RelPos)]
+        self.finished.connect(self.teardown)
 
     def handle_Fix2(self, msg):
         '''display Fix2 data in table'''
@@ -176,15 +177,25 @@ The distance should match the actual distance between the antennas.
                                           rate_str])
 
         
-    def __del__(self):
-        for h in self.handlers:
+    def remove_handlers(self):
+        '''stop receiving messages from the node'''
+        handlers, self.handlers = self.handlers, []
+        for h in handlers:
             h.remove()
+
+    def teardown(self):
+        '''detach from the node when the panel is dismissed'''
+        self.remove_handlers()
+        global _singleton
+        _singleton = None
+
+    def __del__(self):
         global _singleton
         _singleton = None
 
     def closeEvent(self, event):
+        self.teardown()
         super(RTKPanel, self).closeEvent(event)
-        self.__del__()
 
 def spawn(parent, node):
     global _singleton
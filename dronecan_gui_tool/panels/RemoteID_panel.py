@@ -8,11 +8,12 @@
 
 import dronecan
 from functools import partial
-from PyQt5.QtWidgets import QVBoxLayout, QWidget, QLabel, QDialog, \
-    QPlainTextEdit, QPushButton, QLineEdit, QFileDialog, QComboBox, QHBoxLayout
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtWidgets import QVBoxLayout, QLabel, QDialog, \
+    QPushButton, QLineEdit, QHBoxLayout
+from PyQt5.QtCore import Qt
 from logging import getLogger
-from ..widgets import make_icon_button, get_icon, get_monospace_font, directory_selection
+from ..widgets import get_icon, directory_selection
+from .node_selector import NodeSelector
 import random
 import base64
 import struct
@@ -49,7 +50,7 @@ class RemoteIDPanel(QDialog):
         self.send = QPushButton('Send', self)
         self.send.clicked.connect(self.on_send)
 
-        self.node_select = QComboBox()
+        self.node_select = NodeSelector(self)
 
         self.state = QLineEdit()
         self.state.setText("")
@@ -63,8 +64,9 @@ class RemoteIDPanel(QDialog):
 
         self.setLayout(layout)
         self.resize(400, 200)
-        QTimer.singleShot(250, self.update_nodes)
 
+        # dismissing with Esc emits finished but sends no close event
+        self.finished.connect(self.teardown)
 
     def labelWidget(self, label, widget):
         '''a widget with a label'''
@@ -75,6 +77,9 @@ class RemoteIDPanel(QDialog):
 
     def on_send(self):
         '''callback for send button'''
+        if self.node_select.target_node is None:
+            self.status_update("Need to select node")
+            return
         priv_key = self.key_selection.get_selection()
         if priv_key is None:
             self.status_update("Need to select private key")
@@ -86,25 +91,6 @@ class RemoteIDPanel(QDialog):
         '''update status line'''
         self.state.setText(text)
 
-    def update_nodes(self):
-        '''update list of available nodes'''
-        QTimer.singleShot(250, self.update_nodes)
-        from ..widgets.node_monitor import app_node_monitor
-        if app_node_monitor is None:
-            return
-        node_list = []
-        for nid in app_node_monitor._registry.keys():
-            r = app_node_monitor._registry[nid]
-            if r.info is not None:
-                node_list.append("%u: %s" % (nid, r.info.name.decode()))
-            else:
-                node_list.append("%u" % nid)
-        node_list = sorted(node_list)
-        current_node = sorted([self.node_select.itemText(i) for i in range(self.node_select.count())])
-        for n in node_list:
-            if not n in current_node:
-                self.node_select.addItem(n)
-        
     def get_session_key_response(self, reply):
         '''handle session key response'''
         if not reply:
@@ -144,7 +130,7 @@ class RemoteIDPanel(QDialog):
 
     def get_target_node(self):
         '''get the target node'''
-        return int(self.node_select.currentText().split(':')[0])
+        return self.node_select.target_node
 
     def request_session_key(self):
         '''request a session key'''
@@ -158,7 +144,7 @@ class RemoteIDPanel(QDialog):
             self.get_session_key_response,
             timeout=self.timeout)
         self.sequence = (self.sequence+1) % (1<<32)
-        print("Requested session key")
+        logger.debug("Requested session key")
 
     def config_change_response(self, reply):
         if not reply:
@@ -192,9 +178,14 @@ class RemoteIDPanel(QDialog):
         global _singleton
         _singleton = None
 
-    def closeEvent(self, event):
+    def teardown(self):
+        '''stop background work when the panel is dismissed'''
+        self.node_select.stop()
         global _singleton
         _singleton = None
+
+    def closeEvent(self, event):
+        self.teardown()
         super(RemoteIDPanel, self).closeEvent(event)
 
 
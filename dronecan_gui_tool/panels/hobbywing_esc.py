@@ -8,15 +8,13 @@
 
 import dronecan
 from functools import partial
-from PyQt5.QtWidgets import QVBoxLayout, QWidget, QLabel, QDialog, \
-    QPlainTextEdit, QPushButton, QLineEdit, QFileDialog, QComboBox, QHBoxLayout, QSpinBox
+from PyQt5.QtWidgets import QVBoxLayout, QLabel, QDialog, \
+    QPushButton, QComboBox, QHBoxLayout, QSpinBox
 from PyQt5.QtCore import QTimer, Qt
+from PyQt5 import sip
 from logging import getLogger
-from ..widgets import make_icon_button, get_icon, get_monospace_font
+from ..widgets import get_icon
 from ..widgets import table_display
-import random
-import base64
-import struct
 
 __all__ = 'PANEL_NAME', 'spawn', 'get_icon'
 
@@ -26,9 +24,38 @@ logger = getLogger(__name__)
 
 _singleton = None
 
+_SET_BAUD = dronecan.com.hobbywing.esc.SetBaud.Request()
+BAUD_MAP = {
+    1000000 : _SET_BAUD.BAUD_1MBPS,
+    500000 : _SET_BAUD.BAUD_500KBPS,
+    250000 : _SET_BAUD.BAUD_250KBPS,
+    200000 : _SET_BAUD.BAUD_200KBPS,
+    100000 : _SET_BAUD.BAUD_100KBPS,
+    50000 : _SET_BAUD.BAUD_50KBPS,
+}
+
+_SET_RATE = dronecan.com.hobbywing.esc.SetReportingFrequency.Request()
+RATE_MAP = {
+    500 : _SET_RATE.RATE_500HZ,
+    250 : _SET_RATE.RATE_250HZ,
+    200 : _SET_RATE.RATE_200HZ,
+    100 : _SET_RATE.RATE_100HZ,
+    50 : _SET_RATE.RATE_50HZ,
+    20 : _SET_RATE.RATE_20HZ,
+    10 : _SET_RATE.RATE_10HZ,
+    1 : _SET_RATE.RATE_1HZ,
+}
+
 class HobbywingPanel(QDialog):
     DEFAULT_INTERVAL = 0.1
 
+    # (label, default rate, message ID) for each reporting rate row
+    RATE_SETTINGS = [
+        ('Msg1Rate:', "50", 20050),
+        ('Msg2Rate:', "10", 20051),
+        ('Msg3Rate:', "10", 20052),
+    ]
+
     def __init__(self, parent, node):
         super(HobbywingPanel, self).__init__(parent)
         self.setWindowTitle('Hobbywing ESC Panel')
@@ -77,33 +104,16 @@ class HobbywingPanel(QDialog):
         
         layout.addLayout(self.labelWidget('Direction:', [self.direction, self.direction_set]))
 
-        self.msg1rate = QComboBox(self)
-        for r in [0, 1, 10, 20, 50, 100, 200, 250, 500]:
-            self.msg1rate.addItem(str(r))
-        self.msg1rate.setCurrentText("50")
-        self.msg1rate_set = QPushButton('Set', self)
-        self.msg1rate_set.clicked.connect(self.on_msg1rate_set)
-        
-        layout.addLayout(self.labelWidget('Msg1Rate:', [self.msg1rate, self.msg1rate_set]))
-
-        self.msg2rate = QComboBox(self)
-        for r in [0, 1, 10, 20, 50, 100, 200, 250, 500]:
-            self.msg2rate.addItem(str(r))
-        self.msg2rate.setCurrentText("10")
-        self.msg2rate_set = QPushButton('Set', self)
-        self.msg2rate_set.clicked.connect(self.on_msg2rate_set)
-        
-        layout.addLayout(self.labelWidget('Msg2Rate:', [self.msg2rate, self.msg2rate_set]))
-
-        self.msg3rate = QComboBox(self)
-        for r in [0, 1, 10, 20, 50, 100, 200, 250, 500]:
-            self.msg3rate.addItem(str(r))
-        self.msg3rate.setCurrentText("10")
-        self.msg3rate_set = QPushButton('Set', self)
-        self.msg3rate_set.clicked.connect(self.on_msg3rate_set)
-        
-        layout.addLayout(self.labelWidget('Msg3Rate:', [self.msg3rate, self.msg3rate_set]))
-        
+        for label, default_rate, msgid in self.RATE_SETTINGS:
+            rate = QComboBox(self)
+            for r in [0, 1, 10, 20, 50, 100, 200, 250, 500]:
+                rate.addItem(str(r))
+            rate.setCurrentText(default_rate)
+            rate_set = QPushButton('Set', self)
+            rate_set.clicked.connect(partial(self.on_msgrate_set, msgid, rate))
+
+            layout.addLayout(self.labelWidget(label, [rate, rate_set]))
+
         self.setLayout(layout)
         self.resize(400, 200)
 
@@ -111,15 +121,19 @@ class HobbywingPanel(QDialog):
                          node.add_handler(dronecan.com.hobbywing.esc.StatusMsg2, self.handle_StatusMsg2),
                          node.add_handler(dronecan.com.hobbywing.esc.GetEscID, self.handle_GetEscID)]
 
-        QTimer.singleShot(500, self.request_ids)
+        self._request_timer = QTimer(self)
+        self._request_timer.start(500)
+        self._request_timer.timeout.connect(self.request_ids)
 
+        # Esc goes through done() without a close event, so tear down on every dismissal
+        self.finished.connect(self.teardown)
 
     def handle_reply(self, msg):
         '''handle a reply to a set'''
         if msg is not None:
-            print('REPLY: ', dronecan.to_yaml(msg))
+            logger.info('Hobbywing set reply: %s', msg.response)
         else:
-            print("No reply")
+            logger.warning("No reply")
 
     def on_throttleid_set(self):
         '''set throttle ID'''
@@ -142,16 +156,8 @@ class HobbywingPanel(QDialog):
         '''set baudrate'''
         nodeid = self.table.get_selected()
         req = dronecan.com.hobbywing.esc.SetBaud.Request()
-        bmap = {
-            1000000 : req.BAUD_1MBPS,
-            500000 : req.BAUD_500KBPS,
-            250000 : req.BAUD_250KBPS,
-            200000 : req.BAUD_200KBPS,
-            100000 : req.BAUD_100KBPS,
-            50000 : req.BAUD_50KBPS,
-        }
         baudrate = int(self.baudrate.currentText())
-        req.baud = bmap[baudrate]
+        req.baud = BAUD_MAP[baudrate]
         self._node.request(req, nodeid, self.handle_reply)
 
     def on_direction_set(self):
@@ -166,36 +172,16 @@ class HobbywingPanel(QDialog):
         req = dronecan.com.hobbywing.esc.SetReportingFrequency.Request()
         req.option = req.OPTION_WRITE
         req.MSG_ID = msgid
-        rmap = {
-            500 : req.RATE_500HZ,
-            250 : req.RATE_250HZ,
-            200 : req.RATE_200HZ,
-            100 : req.RATE_100HZ,
-            50 : req.RATE_50HZ,
-            20 : req.RATE_20HZ,
-            10 : req.RATE_10HZ,
-            1 : req.RATE_1HZ,
-        }
-        if not rate in rmap:
-            print("Invalid rate %d - must be one of %s" % (rate, ','.join(rmap.keys())))
+        if not rate in RATE_MAP:
+            logger.error("Invalid rate %d - must be one of %s", rate, ','.join(str(r) for r in RATE_MAP))
             return
-        req.rate = rmap[rate]
+        req.rate = RATE_MAP[rate]
         self._node.request(req, nodeid, self.handle_reply)
 
-    def on_msg1rate_set(self):
-        '''set msg1 rate'''
-        nodeid = self.table.get_selected()
-        self.set_rate(nodeid, 20050, int(self.msg1rate.currentText()))
-
-    def on_msg2rate_set(self):
-        '''set msg2 rate'''
+    def on_msgrate_set(self, msgid, rate_select):
+        '''set a message rate from its combo box'''
         nodeid = self.table.get_selected()
-        self.set_rate(nodeid, 20051, int(self.msg1rate.currentText()))
-
-    def on_msg3rate_set(self):
-        '''set msg3 rate'''
-        nodeid = self.table.get_selected()
-        self.set_rate(nodeid, 20052, int(self.msg1rate.currentText()))
+        self.set_rate(nodeid, msgid, int(rate_select.currentText()))
         
     def handle_GetEscID(self, msg):
         '''handle GetEscID'''
@@ -231,7 +217,6 @@ class HobbywingPanel(QDialog):
 
     def request_ids(self):
         '''call GetEscID'''
-        QTimer.singleShot(500, self.request_ids)
         req = dronecan.com.hobbywing.esc.GetEscID()
         req.payload = [0]
         self._node.broadcast(req)
@@ -246,19 +231,35 @@ class HobbywingPanel(QDialog):
             hlayout.addWidget(w)
         return hlayout
 
-    def __del__(self):
-        for h in self.handlers:
+    def remove_handlers(self):
+        '''stop receiving messages from the node'''
+        handlers, self.handlers = self.handlers, []
+        for h in handlers:
             h.remove()
+
+    def __del__(self):
+        global _singleton
+        _singleton = None
+
+    def teardown(self):
+        '''stop background work when the panel is dismissed'''
+        self._request_timer.stop()
+        self.remove_handlers()
         global _singleton
         _singleton = None
 
     def closeEvent(self, event):
+        self.teardown()
         super(HobbywingPanel, self).closeEvent(event)
-        self.__del__()
 
 
 def spawn(parent, node):
     global _singleton
+    # the C++ side may already be gone if the dialog was destroyed without a clean teardown
+    if _singleton is not None and sip.isdeleted(_singleton):
+        # only touches the Python-side handler list, so it is safe on a deleted widget
+        _singleton.remove_handlers()
+        _singleton = None
     if _singleton is None:
         try:
             _singleton = HobbywingPanel(parent, node)
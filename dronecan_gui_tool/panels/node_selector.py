@@ -0,0 +1,68 @@
+#
+# Copyright (C) 2023 DroneCAN Development Team <dronecan.org>
+#
+# This software is distributed under the terms of the MIT License.
+#
+'''
+ a node selection combo box that follows the application node monitor
+'''
+from PyQt5.QtWidgets import QComboBox
+from PyQt5.QtCore import QTimer
+from logging import getLogger
+from ..widgets import node_monitor
+
+logger = getLogger(__name__)
+
+
+class NodeSelector(QComboBox):
+    '''combo box listing the nodes known to the node monitor'''
+
+    def __init__(self, parent=None):
+        super(NodeSelector, self).__init__(parent)
+        self.target_node = None
+        self._known_nodes = set()
+        self.currentTextChanged.connect(self.on_node_changed)
+
+        # poll until the node monitor is up, then follow its update events
+        self._nodes_handler = None
+        self._nodes_timer = QTimer(self)
+        self._nodes_timer.start(250)
+        self._nodes_timer.timeout.connect(self.update_nodes)
+
+    def update_nodes(self):
+        '''update list of available nodes'''
+        app_node_monitor = node_monitor.app_node_monitor
+        if app_node_monitor is None:
+            logger.debug("no app_node_monitor")
+            return
+        if self._nodes_handler is None:
+            self._nodes_timer.stop()
+            self._nodes_handler = app_node_monitor.add_update_handler(lambda _: self.update_nodes())
+        # only rebuild the list when a node appears or its info becomes available
+        known_nodes = set((nid, r.info is not None) for nid, r in app_node_monitor._registry.items())
+        if known_nodes == self._known_nodes:
+            return
+        self._known_nodes = known_nodes
+        node_list = []
+        for nid, r in app_node_monitor._registry.items():
+            if r.info is not None:
+                node_list.append("%u: %s" % (nid, r.info.name.decode()))
+            else:
+                node_list.append("%u" % nid)
+        node_list = sorted(node_list)
+        current_nodes = set(self.itemText(i) for i in range(self.count()))
+        for n in node_list:
+            if n not in current_nodes:
+                logger.debug("Adding %s", n)
+                self.addItem(n)
+
+    def on_node_changed(self, text):
+        '''callback when selected node changes'''
+        self.target_node = int(text.partition(':')[0]) if text else None
+
+    def stop(self):
+        '''stop following the node monitor; safe to call more than once'''
+        self._nodes_timer.stop()
+        if self._nodes_handler is not None:
+            self._nodes_handler.remove()
+            self._nodes_handler = None
@@ -8,12 +8,11 @@
 
 import dronecan
 from functools import partial
-from PyQt5.QtWidgets import QGridLayout, QWidget, QLabel, QDialog, \
-     QTableWidget, QVBoxLayout, QGroupBox, QTableWidgetItem, QLineEdit, \
+from PyQt5.QtWidgets import QLabel, QDialog, QVBoxLayout, QLineEdit, \
      QComboBox, QHBoxLayout, QSpinBox, QCheckBox
 from PyQt5.QtCore import Qt, QTimer
 from ..widgets import get_icon
-from . import rtcm3
+from .node_selector import NodeSelector
 import time
 import socket
 import errno
@@ -25,6 +24,9 @@ PANEL_NAME = 'Serial Forwarding'
 
 _singleton = None
 
+# socket errors meaning "no data yet" on a non-blocking socket
+WOULD_BLOCK_ERRNOS = frozenset([ errno.EAGAIN, errno.EWOULDBLOCK ])
+
 # protocol constants
 PREAMBLE1 = 0xb5
 PREAMBLE2 = 0x62
@@ -342,7 +344,7 @@ class serialPanel(QDialog):
 
         layout = QVBoxLayout()
 
-        self.node_select = QComboBox()
+        self.node_select = NodeSelector(self)
         self.baud_select = QComboBox()
         for b in ["Unchanged", 9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]:
             self.baud_select.addItem(str(b))
@@ -385,8 +387,12 @@ class serialPanel(QDialog):
         self.resize(400, 200)
 
         self.restart_listen()
-        QTimer.singleShot(10, self.check_connection)
-        QTimer.singleShot(250, self.update_nodes)
+
+        self._connection_timer = QTimer(self)
+        self._connection_timer.start(10)
+        self._connection_timer.timeout.connect(self.check_connection)
+
+        self.finished.connect(self.teardown)
 
     def labelWidget(self, label, widget):
         hlayout = QHBoxLayout()
@@ -406,30 +412,15 @@ class serialPanel(QDialog):
         global _singleton
         _singleton = None
 
-    def closeEvent(self, event):
+    def teardown(self):
+        '''stop background work when the panel is dismissed'''
+        self._connection_timer.stop()
+        self.node_select.stop()
         self.__del__()
-        super(serialPanel, self).closeEvent(event)
 
-    def update_nodes(self):
-        '''update list of available nodes'''
-        QTimer.singleShot(250, self.update_nodes)
-        from ..widgets.node_monitor import app_node_monitor
-        if app_node_monitor is None:
-            print("no app_node_monitor")
-            return
-        node_list = []
-        for nid in app_node_monitor._registry.keys():
-            r = app_node_monitor._registry[nid]
-            if r.info is not None:
-                node_list.append("%u: %s" % (nid, r.info.name.decode()))
-            else:
-                node_list.append("%u" % nid)
-        node_list = sorted(node_list)
-        current_node = sorted([self.node_select.itemText(i) for i in range(self.node_select.count())])
-        for n in node_list:
-            if not n in current_node:
-                print("Adding %s" % n)
-                self.node_select.addItem(n)
+    def closeEvent(self, event):
+        self.teardown()
+        super(serialPanel, self).closeEvent(event)
 
     def restart_listen(self):
         '''stop and restart listening socket'''
@@ -529,7 +520,12 @@ class serialPanel(QDialog):
                 print("<< " + msg_types[mtype].format(self.ublox_msg_in))
                 if mtype == (CLASS_CFG,MSG_CFG_PRT) and hasattr(self.ublox_msg_in,'baudRate'):
                     self.tunnel.baudrate = self.ublox_msg_in.baudRate
-                    self.baud_select.setCurrentText("%u" % self.ublox_msg_in.baudRate)
+                    # tunnel already switched, don't let change_baud repeat it
+                    self.baud_select.blockSignals(True)
+                    try:
+                        self.baud_select.setCurrentText("%u" % self.ublox_msg_in.baudRate)
+                    finally:
+                        self.baud_select.blockSignals(False)
                     print("uBlox changed baudrate to %u" % self.ublox_msg_in.baudRate)
                 return
             except Exception as ex:
@@ -556,7 +552,7 @@ class serialPanel(QDialog):
             try:
                 buf = self.sock.recv(120)
             except socket.error as ex:
-                if ex.errno not in [ errno.EAGAIN, errno.EWOULDBLOCK ]:
+                if ex.errno not in WOULD_BLOCK_ERRNOS:
                     self.close_socket()
                 return
             except Exception:
@@ -603,7 +599,6 @@ class serialPanel(QDialog):
             
     def check_connection(self):
         '''called at 100Hz to process data'''
-        QTimer.singleShot(10, self.check_connection)
         if self.sock is not None:
             self.process_socket()
             self.process_tunnel()
@@ -612,11 +607,15 @@ class serialPanel(QDialog):
             try:
                 sock, self.addr = self.listen_sock.accept()
             except Exception as e:
-                if e.errno not in [ errno.EAGAIN, errno.EWOULDBLOCK ]:
+                if e.errno not in WOULD_BLOCK_ERRNOS:
                     print("ucenter listen fail")
                     self.restart_listen()
                     return
                 return
+            if self.node_select.target_node is None:
+                # nothing to forward to yet
+                sock.close()
+                return
             self.sock = sock
             self.sock.setblocking(False)
             self.state.setText("connection from %s:%u" % (self.addr[0], self.addr[1]))
@@ -624,7 +623,7 @@ class serialPanel(QDialog):
             self.num_tx_bytes = 0
             if self.tunnel is not None:
                 self.tunnel.close()
-            target_node = int(self.node_select.currentText().split(':')[0])
+            target_node = self.node_select.target_node
 
             locked = self.lock_select.currentText() == "Locked"
             self.tunnel = dronecan.DroneCANSerial(None, target_node, self.target_dev,
@@ -8,15 +8,11 @@
 
 import dronecan
 from functools import partial
-from PyQt5.QtWidgets import QGridLayout, QWidget, QLabel, QDialog, \
-     QVBoxLayout, QGroupBox, QLineEdit, QPushButton
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QGridLayout, QDialog, \
+     QVBoxLayout, QGroupBox, QPushButton
+from PyQt5.QtCore import Qt
 from ..widgets import get_icon
 from ..widgets import table_display
-from . import rtcm3
-import time
-import socket
-import errno
 
 __all__ = 'PANEL_NAME', 'spawn', 'get_icon'
 
@@ -65,6 +61,7 @@ CAN Stats shows the statistics of the CAN interface.
         self.node = node
         self.handlers = [node.add_handler(dronecan.dronecan.protocol.Stats, self.on_dronecan_stats),
                          node.add_handler(dronecan.dronecan.protocol.CanStats, self.on_can_stats)]
+        self.finished.connect(self.teardown)
         
         self.dronecan_offsets = {}
         self.can_offsets = {}
@@ -124,15 +121,25 @@ CAN Stats shows the statistics of the CAN interface.
             current_values = self.can_stats_table.data[key][2:]
             self.can_offsets[key] = [offset + current for offset, current in zip(self.can_offsets[key], current_values)]
         
-    def __del__(self):
-        for h in self.handlers:
+    def remove_handlers(self):
+        '''stop receiving messages from the node'''
+        handlers, self.handlers = self.handlers, []
+        for h in handlers:
             h.remove()
+
+    def teardown(self):
+        '''detach from the node when the panel is dismissed'''
+        self.remove_handlers()
+        global _singleton
+        _singleton = None
+
+    def __del__(self):
         global _singleton
         _singleton = None
 
     def closeEvent(self, event):
+        self.teardown()
         super(StatsPanel, self).closeEvent(event)
-        self.__del__()
 
 def spawn(parent, node):
     global _singleton
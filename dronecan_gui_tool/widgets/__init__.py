@@ -16,7 +16,7 @@ from PyQt5.QtCore import Qt, QTimer, QStringListModel
 from PyQt5.QtGui import QColor, QKeySequence, QFont, QFontInfo, QIcon
 from logging import getLogger
 import qtawesome
-from functools import partial
+from functools import partial, lru_cache
 
 
 logger = getLogger(__name__)
@@ -219,14 +219,17 @@ class SearchMatcher:
         self.use_regex = use_regex
         self.case_sensitive = case_sensitive
         self.inverse = inverse
+        self._regex = None
 
     def _do_match(self, text):
         if self.use_regex:
             try:
-                flags = re.UNICODE
-                if not self.case_sensitive:
-                    flags |= re.IGNORECASE
-                return bool(re.findall(self.pattern, text, flags=flags))
+                if self._regex is None:
+                    flags = re.UNICODE
+                    if not self.case_sensitive:
+                        flags |= re.IGNORECASE
+                    self._regex = re.compile(self.pattern, flags)
+                return self._regex.search(text) is not None
             except Exception as ex:
                 logger.warning('Regular expression match failed', exc_info=True)
                 raise self.BadPatternException(str(ex))
@@ -455,11 +458,13 @@ class LabelWithIcon(QPushButton):
 
 
 class RealtimeLogWidget(QWidget):
-    def __init__(self, parent, started_by_default=False, pre_redraw_hook=None, **table_options):
+    def __init__(self, parent, started_by_default=False, pre_redraw_hook=None, max_rows=None, **table_options):
         super(RealtimeLogWidget, self).__init__(parent)
 
         self.on_selection_changed = None
 
+        self.max_rows = max_rows
+
         self.pre_redraw_hook = pre_redraw_hook or (lambda: None)
 
         self._table = BasicTable(self, **table_options)
@@ -542,17 +547,29 @@ class RealtimeLogWidget(QWidget):
 
             do_scroll = False
             if not self.paused:
+                items = []
                 while True:
                     try:
-                        item = self._queue.get_nowait()
+                        items.append(self._queue.get_nowait())
                     except queue.Empty:
                         break
 
+                # Items that would be trimmed right away are never rendered
+                if self.max_rows is not None:
+                    items = items[-self.max_rows:]
+
+                for item in items:
                     row = self._table.rowCount()
                     self._table.insertRow(row)
                     self._table.set_row(row, item)
                     do_scroll = True
 
+            # Dropping the oldest rows keeps memory and per-row layout cost bounded on long sessions
+            if self.max_rows is not None:
+                excess = self._table.rowCount() - self.max_rows
+                if excess > 0:
+                    self._table.model().removeRows(0, excess)
+
             self._table.setUpdatesEnabled(True)
 
             if do_scroll:
@@ -587,7 +604,9 @@ class RealtimeLogWidget(QWidget):
         return self._custom_area_layout
 
 
+@lru_cache(maxsize=None)
 def get_icon(name):
+    # QIcon is implicitly shared, so one instance per name can be handed out everywhere
     return qtawesome.icon('fa.' + name)
 
 
@@ -146,10 +146,10 @@ class FileServerJson(dronecan.app.file_server.FileServer):
             self._key_to_path[FileServer_PathKey(path)] = path
 
     def _read(self, e):
-        logger.debug("[#{0:03d}:uavcan.protocol.file.Read] {1!r} @ offset {2:d}"
-                     .format(e.transfer.source_node_id, e.request.path.path.decode(), e.request.offset))
         try:
             key = e.request.path.path.decode()
+            logger.debug("[#%03d:uavcan.protocol.file.Read] %r @ offset %d",
+                         e.transfer.source_node_id, key, e.request.offset)
             if key in self._key_to_path:
                 path = self._key_to_path[key]
             else:
@@ -44,11 +44,14 @@ class LogMessageDisplayWidget(QGroupBox):
                           resize_mode=QHeaderView.Stretch),
     ]
 
+    MAX_ROWS = 10000
+
     def __init__(self, parent, node):
         super(LogMessageDisplayWidget, self).__init__(parent)
         self.setTitle('Log messages (dronecan.uavcan.protocol.debug.LogMessage)')
 
-        self._log_widget = RealtimeLogWidget(self, columns=self.COLUMNS, multi_line_rows=True, started_by_default=True)
+        self._log_widget = RealtimeLogWidget(self, columns=self.COLUMNS, multi_line_rows=True, started_by_default=True,
+                                             max_rows=self.MAX_ROWS)
         self._log_widget.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
         self._log_widget.table.setWordWrap(True)
 
@@ -8,6 +8,7 @@
 
 import dronecan
 import os
+import bisect
 import datetime
 from functools import partial
 from PyQt5.QtWidgets import QDialog, QGridLayout, QLabel, QLineEdit, QGroupBox, QVBoxLayout, QHBoxLayout, QStatusBar,\
@@ -571,6 +572,7 @@ class ConfigParamEditWindow(QDialog):
 
 class ConfigParams(QGroupBox):
     VALUE_COLUMN = 3
+    FETCH_WINDOW = 4        # Max number of param get requests in flight, keeps the TX queue from saturating
 
     def __init__(self, parent, node, target_node_id):
         super(ConfigParams, self).__init__(parent)
@@ -579,6 +581,10 @@ class ConfigParams(QGroupBox):
         self._node = node
         self._target_node_id = target_node_id
         self._retries = 0
+        self._fetch_generation = 0
+        self._fetch_next_index = 0
+        self._fetch_end_index = None
+        self._fetch_in_flight = 0
 
         self._read_all_button = make_icon_button('refresh', 'Fetch all config parameters from the node', self,
                                                  text='Fetch All', on_clicked=self._do_reload)
@@ -625,6 +631,8 @@ class ConfigParams(QGroupBox):
         self._table.on_enter_pressed = self._on_cell_enter_pressed
 
         self._params = []
+        self._param_indices = []
+        self._param_index_by_name = {}
 
         layout = QVBoxLayout(self)
         controls_layout = QHBoxLayout(self)
@@ -651,7 +659,7 @@ class ConfigParams(QGroupBox):
                 try:
                     melody_string = AM32_Rtttl.get_melody_string_from_dronecan_param_value(value)
                 except:
-                    print('Valid melody String')
+                    logger.error('Valid melody String')
                 self._table.item(index, self.VALUE_COLUMN).setText(melody_string)
             else:
                 self._table.item(index, self.VALUE_COLUMN).setText(str(value))
@@ -659,54 +667,83 @@ class ConfigParams(QGroupBox):
         win = ConfigParamEditWindow(self, self._node, self._target_node_id, self._params[index], update_callback)
         win.show()
 
-    def _on_fetch_response(self, index, e):
+    def _send_fetch_request(self, generation, index):
+        self._node.request(dronecan.uavcan.protocol.param.GetSet.Request(index=index),
+                           self._target_node_id,
+                           partial(self._on_fetch_response, generation, index),
+                           priority=REQUEST_PRIORITY)
+
+    def _fetch_more(self):
+        # Keeping several requests in flight, the next index is requested as soon as any response arrives
+        while self._fetch_in_flight < self.FETCH_WINDOW and \
+                (self._fetch_end_index is None or self._fetch_next_index < self._fetch_end_index):
+            self._send_fetch_request(self._fetch_generation, self._fetch_next_index)
+            self._fetch_in_flight += 1
+            self._fetch_next_index += 1
+
+    def _on_fetch_response(self, generation, index, e):
+        if generation != self._fetch_generation:
+            return          # Response to an earlier fetch that has been superseded
+
         if e is None:
-            if self._retries < 5:
+            if self._fetch_end_index is not None and index >= self._fetch_end_index:
+                # Speculative request past the last param, there is nothing to retry for
+                self._fetch_in_flight -= 1
+            elif self._retries < 5:
                 self._retries += 1
                 self.window().show_message('Re-requesting index %d', index)
-                self._node.defer(0.1, lambda: self._node.request(dronecan.uavcan.protocol.param.GetSet.Request(index=index),
-                                                                self._target_node_id,
-                                                                partial(self._on_fetch_response, index),
-                                                                priority=REQUEST_PRIORITY))
+                self._node.defer(0.1, lambda: self._send_fetch_request(generation, index))
+                return
             else:
+                self._fetch_generation += 1
                 self.window().show_message('Param fetch failed: request timed out')
-            return
-
-        # reset retries when we get a response
-        self._retries = 0
-
-        if len(e.response.name) == 0:
-            self.window().show_message('%d params fetched successfully', index)
-            return
+                return
+        else:
+            # reset retries when we get a response
+            self._retries = 0
+            self._fetch_in_flight -= 1
 
-        self._params.append(e.response)
-        self._table.setRowCount(self._table.rowCount() + 1)
-        self._table.set_row(self._table.rowCount() - 1, (index, e.response))
+            if len(e.response.name) == 0:
+                if self._fetch_end_index is None or index < self._fetch_end_index:
+                    self._fetch_end_index = index
+            else:
+                # Responses may arrive out of order, so the rows are kept sorted by index
+                row = bisect.bisect(self._param_indices, index)
+                self._param_indices.insert(row, index)
+                self._params.insert(row, e.response)
+                self._param_index_by_name[str(e.response.name)] = index
+                self._table.insertRow(row)
+                self._table.set_row(row, (index, e.response))
 
         try:
-            index += 1
-            self.window().show_message('Requesting index %d', index)
-            self._node.defer(0.1, lambda: self._node.request(dronecan.uavcan.protocol.param.GetSet.Request(index=index),
-                                                             self._target_node_id,
-                                                             partial(self._on_fetch_response, index),
-                                                             priority=REQUEST_PRIORITY))
+            self._fetch_more()
         except Exception as ex:
             logger.error('Param fetch error', exc_info=True)
             self.window().show_message('Could not send param get request: %r', ex)
+            return
+
+        if self._fetch_in_flight == 0:
+            self.window().show_message('%d params fetched successfully', len(self._params))
+        else:
+            self.window().show_message('Requesting index %d', self._fetch_next_index - 1)
 
     def _do_reload(self):
+        self._fetch_generation += 1
+        self._fetch_next_index = 0
+        self._fetch_end_index = None
+        self._fetch_in_flight = 0
+        self._retries = 0
+        # Cleared before sending, so that no response of this generation can land in the old rows
+        self._table.setRowCount(0)
+        self._params = []
+        self._param_indices = []
+        self._param_index_by_name = {}
         try:
-            index = 0
-            self._node.request(dronecan.uavcan.protocol.param.GetSet.Request(index=index),
-                               self._target_node_id,
-                               partial(self._on_fetch_response, index),
-                               priority=REQUEST_PRIORITY)
+            self._fetch_more()
         except Exception as ex:
             show_error('Node error', 'Could not send param get request', ex, self)
         else:
             self.window().show_message('Param fetch request sent')
-            self._table.setRowCount(0)
-            self._params = []
 
     def param_as_string(self, value, is_melody=False):
         value_type = dronecan.get_active_union_field(value)
@@ -723,7 +760,7 @@ class ConfigParams(QGroupBox):
                 try:
                     melody_string = AM32_Rtttl.get_melody_string_from_dronecan_param_value(value.string_value)
                 except:
-                    print('Valid melody String')
+                    logger.error('Valid melody String')
                 return melody_string
             else:
                 return value.string_value
@@ -749,14 +786,16 @@ class ConfigParams(QGroupBox):
 
     def _on_send_response(self, e):
         if e is None:
-            self.show_message('Request timed out')
+            self.window().show_message('Request timed out')
         else:
-            for i in range(len(self._params)):
-                p = self._params[i]
-                name = str(p.name)
-                if name == str(e.response.name):
-                    logger.info('set %s to %s' % (name, self.param_as_string(e.response.value)))
-                    self._table.item(i, self.VALUE_COLUMN).setText(self.param_as_string(e.response.value, AM32_Rtttl.is_am32_melody_param(p)))
+            name = str(e.response.name)
+            index = self._param_index_by_name.get(name)
+            if index is None:
+                return
+            i = bisect.bisect_left(self._param_indices, index)
+            p = self._params[i]
+            logger.info('set %s to %s' % (name, self.param_as_string(e.response.value)))
+            self._table.item(i, self.VALUE_COLUMN).setText(self.param_as_string(e.response.value, AM32_Rtttl.is_am32_melody_param(p)))
 
     def save_param(self, name, old_value, str_value):
         value_type = dronecan.get_active_union_field(old_value)
@@ -9,10 +9,13 @@ import time
 
 class TableDisplay(QTableWidget):
     '''table viewer'''
+    RESIZE_INTERVAL_MS = 200
+
     def __init__(self, headers, expire_time=2.0):
         QTableWidget.__init__(self, 0, len(headers))
         self.headers = headers
         self.row_keys = []
+        self.row_index = {}
         self.timestamps = {}
         self.setHorizontalHeaderLabels(self.headers)
         self.resizeColumnsToContents()
@@ -20,26 +23,43 @@ class TableDisplay(QTableWidget):
         self.expire_time = expire_time
         self.show()
         self.data = {}
+        # resizing to contents measures every cell, so it is done at most once per RESIZE_INTERVAL_MS
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self.resize_to_contents)
         if self.expire_time is not None:
-            QTimer.singleShot(int(expire_time*500), self.check_expired)
+            self._expire_timer = QTimer(self)
+            self._expire_timer.start(int(expire_time*500))
+            self._expire_timer.timeout.connect(self.check_expired)
 
     def update(self, row_key, row):
         '''update a row'''
-        if not row_key in self.row_keys:
+        row_idx = self.row_index.get(row_key)
+        if row_idx is None:
             # new row
-            self.timestamps[row_key] = time.time()
-            self.insertRow(len(self.row_keys))
+            row_idx = len(self.row_keys)
+            self.insertRow(row_idx)
             self.row_keys.append(row_key)
+            self.row_index[row_key] = row_idx
 
         self.timestamps[row_key] = time.time()
-        row_idx = self.row_keys.index(row_key)
         self.data[row_key] = row
         for i in range(len(row)):
-            self.setItem(row_idx, i, QTableWidgetItem(str(row[i])))
+            text = str(row[i])
+            item = self.item(row_idx, i)
+            if item is None:
+                self.setItem(row_idx, i, QTableWidgetItem(text))
+            elif item.text() != text:
+                # reuse the existing cell rather than allocating a new item per update
+                item.setText(text)
+
+        if not self._resize_timer.isActive():
+            self._resize_timer.start(self.RESIZE_INTERVAL_MS)
 
+    def resize_to_contents(self):
+        '''fit columns and rows to the current contents'''
         self.resizeColumnsToContents()
         self.resizeRowsToContents()
-        self.show()
 
     def get(self, row_key):
         '''get current data for a row'''
@@ -54,12 +74,15 @@ class TableDisplay(QTableWidget):
 
     def remove_row(self, row_key):
         '''remove a row'''
-        if not row_key in self.row_keys:
+        row_idx = self.row_index.pop(row_key, None)
+        if row_idx is None:
             return
-        row_idx = self.row_keys.index(row_key)
-        if row_idx != -1:
-            self.row_keys.pop(row_idx)
-            self.removeRow(row_idx)
+        self.timestamps.pop(row_key, None)
+        self.data.pop(row_key, None)
+        self.row_keys.pop(row_idx)
+        self.removeRow(row_idx)
+        # rows below the removed one have moved up
+        self.row_index = {key: idx for idx, key in enumerate(self.row_keys)}
 
     def check_expired(self):
         '''check for expired rows'''
@@ -68,8 +91,6 @@ class TableDisplay(QTableWidget):
         for key in keys:
             if now - self.timestamps[key] >= self.expire_time:
                 # remove old rows
-                self.timestamps.pop(key)
                 self.remove_row(key)
-        QTimer.singleShot(int(self.expire_time*500), self.check_expired)
 
 